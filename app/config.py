@@ -54,6 +54,8 @@ class Settings(BaseSettings):
     # App Settings
     debug: bool = False
     log_level: str = "INFO"
+    api_workers: int = 4  # Uvicorn worker processes (ignored with reload)
+    cors_origins: list[str] = ["http://localhost:3000", "http://localhost:8000"]
 
     @property
     def sync_database_url(self) -> str:
@@ -3,8 +3,9 @@ Database connection and session management.
 """
 
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator
 
+import orjson
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
@@ -16,6 +17,12 @@ from app.config import get_settings
 
 settings = get_settings()
 
+
+def json_serializer(obj: Any) -> str:
+    """Serialize JSON/JSONB column values with orjson."""
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 # Create async engine
 engine = create_async_engine(
     settings.database_url,
@@ -23,6 +30,8 @@ engine = create_async_engine(
     pool_pre_ping=True,
     pool_size=10,
     max_overflow=20,
+    json_serializer=json_serializer,
+    json_deserializer=orjson.loads,
 )
 
 # Create async session factory
@@ -7,7 +7,8 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response
 
 from app.config import get_settings
 from app.database import init_db, close_db
@@ -57,19 +58,26 @@ app = FastAPI(
     description="Intelligent AI assistant with multi-agent system and context retrieval",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/docs" if settings.debug else None,
     redoc_url="/redoc" if settings.debug else None,
+    openapi_url="/openapi.json" if settings.debug else None,
+    # Routes are registered without trailing slashes; skip the redirect probe
+    redirect_slashes=False,
 )
 
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],  # Configure properly in production
+    allow_origins=settings.cors_origins,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE"],
+    allow_headers=["Authorization", "Content-Type"],
 )
 
+# Compress larger JSON payloads (added last so it wraps the other middleware)
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
 
 # Exception handlers
 @app.exception_handler(Exception)
@@ -77,7 +85,7 @@ async def global_exception_handler(request: Request, exc: Exception):
     """Global exception handler."""
     logger.error(f"Unhandled exception: {exc}", exc_info=True)
 
-    return JSONResponse(
+    return ORJSONResponse(
         status_code=500,
         content={
             "error": "Internal server error",
@@ -90,14 +98,17 @@ async def global_exception_handler(request: Request, exc: Exception):
 app.include_router(api_router)
 
 
-# Health check endpoint
+# Health check endpoint (body is static, so serialize it once)
+_HEALTH_BODY = ORJSONResponse({
+    "status": "healthy",
+    "version": "1.0.0",
+}).body
+
+
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
-    return {
-        "status": "healthy",
-        "version": "1.0.0",
-    }
+    return Response(content=_HEALTH_BODY, media_type="application/json")
 
 
 # Ready check endpoint
@@ -115,7 +126,7 @@ async def ready_check():
             "database": "connected",
         }
     except Exception as e:
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=503,
             content={
                 "status": "not_ready",
@@ -132,5 +143,6 @@ if __name__ == "__main__":
         host="0.0.0.0",
         port=8000,
         reload=settings.debug,
+        workers=1 if settings.debug else settings.api_workers,
         log_level=settings.log_level.lower(),
     )